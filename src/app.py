@@ -36,6 +36,8 @@ menu_ = ["Beranda", "Data Tweets", "Pemrosesan Teks", "Pembobotan Teks",
          "Analisis", "Prediksi"]
 icons_ = ["house", "database", "code-slash", "layout-text-sidebar",
           "bar-chart"]
+# Antrean job latar belakang yang dipakai bersama oleh semua sesi
+jobs = get_job_scheduler()
 
 # Exception message function
 def _exceptionMessage(e):
@@ -53,6 +55,58 @@ def _exceptionMessage(e):
         if message:
             st.exception(e)
 
+def _runJob(label, func, *args, deps= ()):
+    """Jalankan job di latar belakang dan tampilkan progress-nya
+
+    Job yang sama hanya dijalankan sekali; halaman tidak menunggu job
+    selesai, melainkan memeriksa statusnya setiap detik lalu memuat ulang
+    halaman ketika job selesai.
+
+    Parameters
+    ----------
+    label : str
+        Nama tahapan yang ditampilkan.
+
+    func : callable
+        Fungsi job (lihat JobScheduler.submit).
+
+    *args : any
+        Argumen untuk fungsi job.
+
+    deps : iterable of str
+        File input job.
+
+    Returns
+    -------
+    any
+        Hasil job jika sudah selesai, atau None jika masih berjalan atau gagal.
+    """
+    job_id = jobs.submit(func, *args, deps= deps)
+    status = jobs.status(job_id)
+    if status["status"] in ("done", "failed"):
+        # Tahapan di dalam job tercatat di worker, tampilkan di panel
+        # diagnostik
+        profiler.extend(status.get("records") or [], source= label)
+    if status["status"] == "done":
+        return status["result"]
+    if status["status"] == "failed":
+        st.error(f"{label} gagal: {status['error']}")
+        if st.button("Coba lagi", key= f"retry_{job_id}"):
+            jobs.submit(func, *args, deps= deps, retry= True)
+            st.rerun()
+        return None
+
+    @st.fragment(run_every= 1)
+    def _progress():
+        status = jobs.status(job_id)
+        if status["status"] in ("done", "failed"):
+            st.rerun()
+        st.progress(status["progress"],
+                    text= f"{label}: {status['message'] or status['status']}")
+    _progress()
+    st.info("Job berjalan di latar belakang, halaman lain tetap dapat dibuka.")
+    return None
+
 # Halaman beranda
 def _pageBeranda():
     """Page beranda
@@ -84,11 +138,41 @@ def _pageDataTweets():
         ms_20()
         show_title("Data Tweets", division= True)
         ms_40()
-        # Dapatkan file .csv yang menyimpan data tweet
-        df = get_csv("./data/dataset/tweets.csv", delimiter= ";")
+        # Filter dan paging dijalankan di server pada dataset kolom, sehingga
+        # hanya satu halaman yang dikirim ke browser
+        source = "./data/dataset/tweets.csv"
+        left, right = ml_split()
+        with left:
+            search = st.text_input("Cari tweet")
+        with right:
+            label = st.selectbox("Sentimen", ["Semua"] +
+                                 datasets.unique(source, "sentimen"))
+        page_size = 100
+        page = st.number_input("Halaman", min_value= 1, value= 1)
+        df, n_rows = datasets.page(
+            source, page, page_size, search= search, search_column= "text",
+            where= None if label == "Semua" else {"sentimen": label})
         # Tampilkan DataFrame dari data yang telah didapatkan
-        st.dataframe(df, height= 600, use_container_width= True,
-                     hide_index= True)
+        st.dataframe(df, height= 600, use_container_width= True)
+        n_pages = max(1, -(-n_rows // page_size))
+        st.caption(f"Halaman {min(page, n_pages)} dari {n_pages} "
+                   f"({n_rows} tweet)")
+        with st.expander("**Impor Hasil Crawler**"):
+            # Tambahkan tweet baru dari file hasil crawler ke tweets.csv
+            uploaded = st.file_uploader("File CSV hasil crawler", type= "csv")
+            if uploaded is not None:
+                filepath = os.path.join("./data/dataset/crawl", uploaded.name)
+                if not os.path.exists(filepath) or \
+                        os.path.getsize(filepath) != uploaded.size:
+                    mk_dir(os.path.dirname(filepath))
+                    with open(filepath, "wb") as f:
+                        f.write(uploaded.getbuffer())
+                stats = _runJob("Impor tweet", ingest_crawler_export,
+                                filepath, deps= [filepath])
+                if stats is not None:
+                    st.success(f"{stats['appended']} tweet ditambahkan, "
+                               f"{stats['duplicate']} duplikat, "
+                               f"{stats['lang']} bahasa lain dilewati")
     except Exception as e:
         _exceptionMessage(e)
 
@@ -104,24 +188,22 @@ def _pageTextPreprocessing():
         show_title("Pemrosesan Teks", division= True)
         ms_40()
         # Dapatkan file .csv yang menyimpan data tweet
-        ori_text = get_csv("./data/dataset/tweets.csv", delimiter= ";")
-        # Buat DataFrame untuk menampung hasil pemrosesan teks
-        pre_text = pd.DataFrame()
-        # Pemrosesan text cleaning
-        pre_text["text_cleaning"] = ori_text.iloc[:, 0].apply(text_cleaning)
-        # Simpan unique word untuk identifikasi lebih lanjut
-        write_unique_words(pre_text["text_cleaning"].values)
-        # Pemrosesan slang-word removal
-        pre_text["slang_removal"] = remv_slang(pre_text["text_cleaning"])
-        # Pemrosesan tokenization
-        pre_text["tokenization"] = pre_text["slang_removal"].apply(lambda x: word_tokenize(x))
-        with st.spinner("Please wait..."):
-            # Pemrosesan stemming
-            pre_text["stemming"] = stemming(pre_text["tokenization"])
-        # Pemrosesan stopword-removal
-        pre_text["stopword_removal"] = stopword_removal(pre_text["stemming"])
-        # Final Result
-        pre_text["final"] = pre_text["stopword_removal"].apply(lambda x: " ".join(x))
+        ori_text = datasets.read("./data/dataset/tweets.csv", columns= ["text"])
+        # Pemrosesan teks hanya untuk tweet yang baru atau berubah dijalankan
+        # di latar belakang, hasilnya tersimpan di prepros_result.csv
+        filepath = _runJob("Pemrosesan teks", job_text_preprocessing,
+                           "./data/dataset/tweets.csv",
+                           "./data/dataset/prepros_result.csv",
+                           lexicon_signature(),
+                           deps= ["./data/dataset/tweets.csv"])
+        if filepath is None:
+            return
+        pre_text = datasets.read(filepath)
+        # Frekuensi kata diperbarui oleh job, muat ulang jika state berubah
+        stats_path = "./data/corpus/word_stats.pkl"
+        version = os.stat(stats_path).st_mtime_ns \
+            if os.path.exists(stats_path) else None
+        word_stats = get_word_stats(version= version)
         # View result
         with st.expander("**Original Tweets**", expanded= True):
             # Tampilkan DataFrame untuk teks tweet sebelum text cleaning
@@ -139,10 +221,22 @@ def _pageTextPreprocessing():
             # Tampilkan DataFrame untuk teks tweet setelah tokenisasi
             st.dataframe(pre_text["tokenization"], height= 500,
                          use_container_width= True, hide_index= True)
+            # Pastikan tokenizer cepat identik dengan word_tokenize
+            if st.button("Periksa tokenizer"):
+                diff = check_tokenizer(pre_text["slang_removal"])
+                if diff.empty:
+                    st.success("Hasil tokenizer identik dengan word_tokenize")
+                else:
+                    st.warning(f"{len(diff)} tweet berbeda")
+                    st.dataframe(diff, use_container_width= True)
         with st.expander("**Stemming/Lemmatization**"):
             # Tampilkan DataFrame untuk teks tweet setelah proses stemming
             st.dataframe(pre_text["stemming"], height= 500,
                          use_container_width= True, hide_index= True)
+            # Tampilkan statistik cache stemming
+            stats = get_stem_cache().stats()
+            st.caption(f"Stem cache: {stats['hits']} hit, {stats['misses']} "
+                       f"miss, {stats['entries']} entri")
         with st.expander("**Stopword Removal**"):
             # Tampilkan DataFrame untuk teks tweet setelah proses stopword removal
             st.dataframe(pre_text["stopword_removal"], height= 500,
@@ -151,8 +245,13 @@ def _pageTextPreprocessing():
             # Tampilkan DataFrame untuk teks tweet hasil semua text preprocessing
             st.dataframe(pre_text["final"], height= 500,
                          use_container_width= True, hide_index= True)
-        # Simpan DataFrame hasil text preprocessing
-        pre_text.to_csv("./data/dataset/prepros_result.csv", index= False)
+        with st.expander("**Frekuensi Kata**"):
+            # Tampilkan kata dengan frekuensi tertinggi
+            n = st.slider("Jumlah kata", 10, 500, 50, step= 10)
+            st.dataframe(word_stats.top(n), height= 500,
+                         use_container_width= True, hide_index= True)
+            st.caption(f"{word_stats.total} kata dari "
+                       f"{word_stats.rows} tweet")
     except Exception as e:
         _exceptionMessage(e)
 
@@ -167,38 +266,60 @@ def _pageFeaturesExtraction():
         ms_20()
         show_title("Pembobotan Teks", division= True)
         ms_40()
-        # Dapatkan file .csv untuk hasil pemrosesan teks dan data sentimen
-        # setiap dokumen
-        tweets = get_csv("./data/dataset/prepros_result.csv", usecols= ["final"])
-        labels = get_csv("./data/dataset/tweets.csv", delimiter= ";",
-                         usecols= ["sentimen"])
+        # Splitting data dan pembobotan dijalankan di latar belakang setelah
+        # pemrosesan teks selesai
+        if _runJob("Pemrosesan teks", job_text_preprocessing,
+                   "./data/dataset/tweets.csv",
+                   "./data/dataset/prepros_result.csv", lexicon_signature(),
+                   deps= ["./data/dataset/tweets.csv"]) is None:
+            return
+        run_id = _runJob("Pembobotan teks", job_feature_extraction,
+                         deps= ["./data/dataset/prepros_result.csv",
+                                "./data/dataset/tweets.csv"])
+        if run_id is None:
+            return
+        # Simpan run fitur milik sesi ini agar tidak tertukar dengan run dari
+        # sesi lain
+        ss.features_run = run_id
+        data = artifacts.load(run_id, ["X_train", "train_vectors",
+                                       "vectorizer"])
+        train_vectors, vectorizer = data["train_vectors"], data["vectorizer"]
         # Splitting layout
         left, right = ml_split()
         with left:
-            tweets.columns = ["tweets"] # Ubah nama kolom data
-            # Gabungkan 2 DataFrame
-            data = pd.concat([tweets, labels], axis= 1)
-            data = data.dropna()
-            # Lakukan splitting data dan pembobotan untuk proses analisis
-            train_vectors, test_vectors, vectorizer = feature_extraction(
-                data["tweets"].values, data["sentimen"].values)
             # Tampilkan DataFrame
-            with open("./data/temp/X_train.pickle", "rb") as file:
-                X_train = pickle.load(file)
+            X_train = data["X_train"]
             show_caption("Original Tweets")
             st.dataframe(X_train, use_container_width= True, hide_index= True)
         with right:
-            # Konversi train_vectors dan test_vectors ke DataFrame
-            train_df = pd.DataFrame(train_vectors.toarray(),
-                                    columns= vectorizer.get_feature_names_out())
-            test_df = pd.DataFrame(test_vectors.toarray(),
-                                   columns= vectorizer.get_feature_names_out())
-            # Tampilkan hasil pembobotan teks
+            # Tampilkan hasil pembobotan teks per halaman langsung dari
+            # matriks sparse tanpa mengubahnya menjadi matriks dense
             show_caption("Hasil Pembobotan Kata")
-            st.dataframe(train_df, use_container_width= True, hide_index= True)
+            page_size = 50
+            n_pages = max(1, -(-train_vectors.shape[0] // page_size))
+            page = st.number_input(f"Halaman (1-{n_pages})", min_value= 1,
+                                   max_value= n_pages, value= 1)
+            start = (page - 1) * page_size
+            st.dataframe(tfidf_top_terms(train_vectors,
+                                         vectorizer.get_feature_names_out(),
+                                         start, start + page_size),
+                         use_container_width= True, hide_index= True)
+        with st.expander("**Statistik Kata**"):
+            # Tampilkan document frequency dan IDF setiap kata
+            st.dataframe(tfidf_term_stats(train_vectors, vectorizer),
+                         use_container_width= True, hide_index= True)
     except Exception as e:
         _exceptionMessage(e)
 
+@st.cache_data(show_spinner= False)
+def _onlineHoldoutPage(run_id, start, stop):
+    """Satu halaman prediksi data uji untuk model out-of-core
+
+    Di-cache per run "online" dan halaman.
+    """
+    model = artifacts.load(run_id, ["model"])["model"]
+    return holdout_page(model, start, stop)
+
 # Halaman analisis
 def _pageAnalisis():
     """Page Analisis
@@ -208,45 +329,98 @@ def _pageAnalisis():
         show_title("Analisis Sentimen Tweets")
         show_caption("Metode Logistic Regression", division= True)
         ms_40()
-        # Ambil DataFrame untuk proses analisis
-        with open("./data/temp/train_vectors.pickle", "rb") as file:
-            train_vectors = pickle.load(file)
-        with open("./data/temp/test_vectors.pickle", "rb") as file:
-            test_vectors = pickle.load(file)
-        with open("./data/temp/X_train.pickle", "rb") as file:
-            X_train = pickle.load(file)
-        with open("./data/temp/X_test.pickle", "rb") as file:
-            X_test = pickle.load(file)
-        with open("./data/temp/y_train.pickle", "rb") as file:
-            y_train = pickle.load(file)
-        with open("./data/temp/y_test.pickle", "rb") as file:
-            y_test = pickle.load(file)
-        # Training model Regresi Logistik
-        model = model_trained(train_vectors, y_train, C= 0.01)
-        # Lakukan prediksi pada data test dengan model yang telah dilatih
-        y_pred = model.predict(test_vectors)
-        # Buat DataFrame yang menggabungkan semua elemen data untuk ditampilkan
-        test_df = pd.DataFrame({
-            "tweets": X_test,
-            "sentimen": y_test,
-            "prediksi": y_pred
-        })
-        train_df = pd.DataFrame({
-            "tweets": X_train,
-            "sentimen": y_train
-        })
-        # Tampilkan hasil analisis
+        # Ambil data untuk proses analisis dari run fitur milik sesi ini,
+        # atau run fitur terakhir
+        run_id = ss.get("features_run") or artifacts.latest("features")
+        data = artifacts.load(run_id, ["train_vectors", "test_vectors",
+                                       "X_train", "X_test", "y_train",
+                                       "y_test"])
+        train_vectors, test_vectors = data["train_vectors"], data["test_vectors"]
+        X_train, X_test = data["X_train"], data["X_test"]
+        y_train, y_test = data["y_train"], data["y_test"]
+        mode = st.radio("Mode training", ["Standar", "Out-of-core"],
+                        horizontal= True)
+        with st.expander("**Pencarian Hyperparameter**"):
+            # Cari kombinasi C, penalty, dan solver terbaik dengan
+            # cross-validation pada data training di latar belakang
+            if st.button("Jalankan pencarian"):
+                ss.search_run = run_id
+            if ss.get("search_run") == run_id:
+                leaderboard = _runJob("Pencarian hyperparameter",
+                                      job_hyperparameter_search, run_id)
+                if leaderboard is not None:
+                    ss.leaderboard = pd.DataFrame(leaderboard)
+            if "leaderboard" in ss:
+                st.dataframe(ss.leaderboard, use_container_width= True,
+                             hide_index= True)
+                best = ss.leaderboard.iloc[0]
+                st.info(f"Terbaik: C={best['C']}, penalty={best['penalty']}, "
+                        f"solver={best['solver']}")
+        if mode == "Standar":
+            # Training model Regresi Logistik dengan hyperparameter terbaik
+            # dari hasil pencarian, atau C=0.01 jika belum ada
+            params = {"C": 0.01}
+            if "leaderboard" in ss:
+                best = ss.leaderboard.iloc[0]
+                params = {"C": float(best["C"]), "solver": best["solver"],
+                          **penalty_params(best["penalty"])}
+            model_run = _runJob("Training model", job_model_trained, run_id,
+                                params)
+            if model_run is None:
+                return
+            if ss.get("model_run") != model_run:
+                # Model baru dilatih oleh worker, muat ulang jalur prediksi
+                load_predictor.clear()
+                ss.model_run = model_run
+            model = artifacts.load(model_run, ["model"])["model"]
+            # Lakukan prediksi pada data test dengan model yang telah dilatih
+            y_pred = model.predict(test_vectors)
+            classes = list(np.unique(y_test))
+            cm = confusion_matrix(y_true= y_test, y_pred= y_pred,
+                                  labels= classes)
+            train_counts = [int(np.sum(y_train == label))
+                            for label in classes]
+            n_test = len(y_test)
+            # Ambil satu halaman data uji untuk ditampilkan
+            page_rows = lambda start, stop: pd.DataFrame({
+                "tweets": X_test[start:stop],
+                "sentimen": y_test[start:stop],
+                "prediksi": y_pred[start:stop]
+            })
+        else:
+            # Training inkremental per chunk dari file dengan fitur hashing,
+            # dilanjutkan dari model sebelumnya hanya dengan baris baru
+            online_run = _runJob("Training out-of-core", job_train_out_of_core,
+                                 deps= ["./data/dataset/prepros_result.csv",
+                                        "./data/dataset/tweets.csv"])
+            if online_run is None:
+                return
+            # Metrik agregat dihitung per chunk oleh job training, sehingga
+            # data uji tidak dimuat ke halaman ini
+            metrics = artifacts.load(online_run, ["metrics"])["metrics"]
+            classes = metrics["classes"]
+            cm = np.asarray(metrics["confusion_matrix"])
+            train_counts = metrics["train_counts"]
+            n_test = int(cm.sum())
+            page_rows = lambda start, stop: _onlineHoldoutPage(online_run,
+                                                               start, stop)
+        # Tampilkan hasil analisis per halaman
         show_caption("Hasil Analisis")
-        st.dataframe(test_df, use_container_width= True, hide_index= True)
-        # Hitung nilai akurasi
-        accuracy = accuracy_score(y_true= y_test, y_pred= y_pred)
+        page_size = 1000
+        n_pages = max(1, -(-n_test // page_size))
+        page = st.number_input(f"Halaman (1-{n_pages})", min_value= 1,
+                               max_value= n_pages, value= 1,
+                               key= "analisis_page")
+        start = (page - 1) * page_size
+        st.dataframe(page_rows(start, start + page_size),
+                     use_container_width= True, hide_index= True)
+        # Buat classification report dari confusion matrix
+        cr = confusion_report(cm, classes)
         # Tampilkan nilai akurasi
-        st.success(f"Nilai Akurasi: {accuracy * 100:.2f}%")
-        # Hitung jumlah data di setiap kelas
-        positif = test_df["sentimen"].value_counts()[0]
-        negatif = test_df["sentimen"].value_counts()[1]
-        positif += train_df["sentimen"].value_counts()[0]
-        negatif += train_df["sentimen"].value_counts()[1]
+        st.success(f"Nilai Akurasi: {cr['accuracy'] * 100:.2f}%")
+        # Hitung jumlah data di setiap kelas (data uji dan data latih)
+        counts = dict(zip(classes, cm.sum(axis= 1) + np.asarray(train_counts)))
+        positif, negatif = counts.get("positif", 0), counts.get("negatif", 0)
         # Tampilkan jumlah data di setiap kelas
         st.info(f"""
                 **Jumlah data masing-masing kelas**\n
@@ -254,19 +428,14 @@ def _pageAnalisis():
                 Label negatif: {negatif}
         """)
         ms_20()
-        # Buat classification report untuk melihat hasil
-        cr = classification_report(y_true= y_test, y_pred= y_pred,
-                                   output_dict= True)
         # Tampilkan classification report
         show_caption("Classification Report")
         st.dataframe(pd.DataFrame(cr).transpose(), use_container_width= True)
         ms_20()
         # Tampilkan confusion matrix
-        cm = confusion_matrix(y_true= y_test, y_pred= y_pred)
-        # Tampilkan confusion matrix
         show_caption("Confusion Matrix")
         with ml_center():
-            plot_confusion_matrix(cm, classes= np.unique(y_test))
+            plot_confusion_matrix(cm, classes= classes)
     except Exception as e:
         _exceptionMessage(e)
 
@@ -281,13 +450,45 @@ def _pagePrediksi():
 
         if st.button("Prediksi"):
             if len(cek) != 0:
-                result = np.random.choice(["Positif", "Negatif"])
-                st.success(result)
+                result = predict_sentiment(
+                    [cek], model_id= ss.get("model_run")).iloc[0]
+                st.success(result["prediksi"].capitalize())
+                # Tampilkan probabilitas setiap kelas
+                for label, proba in result.drop("prediksi").items():
+                    st.progress(float(proba),
+                                text= f"{label.capitalize()}: {proba:.2%}")
             else:
                 st.warning("Input tidak valid")
     except Exception as e:
         _exceptionMessage(e)
 
+def _diagnosticsPanel():
+    """Panel diagnostik
+
+    Menampilkan lama eksekusi, jumlah baris, memori puncak, dan hit rate
+    cache setiap tahapan yang dijalankan pada run saat ini.
+    """
+    records = profiler.records()
+    if not records:
+        return
+    ms_40()
+    with st.expander("**Diagnostik**"):
+        st.dataframe(profiler.to_frame(), use_container_width= True,
+                     hide_index= True)
+        if any(r.get("peak_mem_shared") for r in records):
+            st.caption("Memori puncak diukur untuk seluruh proses; tahapan "
+                       "bertanda *memori bercampur* berjalan bersamaan "
+                       "dengan sesi lain yang juga mengukur memori.")
+        left, right = ml_split()
+        with left:
+            st.download_button("Unduh JSON", profiler.to_json(),
+                               file_name= "diagnostik.json",
+                               mime= "application/json")
+        with right:
+            st.download_button("Unduh trace", profiler.to_trace(),
+                               file_name= "trace.json",
+                               mime= "application/json")
+
 #-------------------------------------------------------------------------------
 # Body
 with st.container():
@@ -304,19 +505,27 @@ with st.container():
                 "nav-link-selected": {"background-color": "#F4F4F8"}
             }
         )
+        # Pengukuran memori puncak menambah overhead pada setiap tahapan
+        memory = st.checkbox("Ukur memori", value= False)
         ms_60()
         show_caption("Copyright © 2024 | Yafi Zafran", size= 5)
 
-    # Branching halaman yang ditampilkan
-    if selected == menu_[0]:
-        _pageBeranda()
-    elif selected == menu_[1]:
-        _pageDataTweets()
-    elif selected == menu_[2]:
-        _pageTextPreprocessing()
-    elif selected == menu_[3]:
-        _pageFeaturesExtraction()
-    elif selected == menu_[4]:
-        _pageAnalisis()
-    elif selected == menu_[5]:
-        _pagePrediksi()
\ No newline at end of file
+    # Record instrumentasi dipisah per sesi; setiap run hanya menampilkan
+    # tahapan yang dijalankannya sendiri
+    ss.setdefault("profiler_run", os.urandom(8).hex())
+    with profiler.session(ss.profiler_run, memory= memory):
+        profiler.reset()
+        # Branching halaman yang ditampilkan
+        if selected == menu_[0]:
+            _pageBeranda()
+        elif selected == menu_[1]:
+            _pageDataTweets()
+        elif selected == menu_[2]:
+            _pageTextPreprocessing()
+        elif selected == menu_[3]:
+            _pageFeaturesExtraction()
+        elif selected == menu_[4]:
+            _pageAnalisis()
+        elif selected == menu_[5]:
+            _pagePrediksi()
+        _diagnosticsPanel()
\ No newline at end of file
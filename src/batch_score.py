@@ -0,0 +1,144 @@
+# Library / module / pustaka
+import argparse, os, sys, time
+
+from functions import *
+
+"""Batch scoring
+
+Skrip untuk memprediksi sentimen seluruh tweet dalam file CSV tanpa membuka
+Streamlit. Input dapat berupa file dengan format `tweets.csv` (kolom `text`,
+dipisahkan `;`) maupun hasil crawler `data_tweets.csv` (kolom `full_text`,
+dipisahkan `,`). Jalankan dari root repository:
+
+    $ python src/batch_score.py data/dataset/data_tweets.csv hasil.csv
+"""
+
+# Kolom teks yang dikenali, sesuai urutan prioritas
+TEXT_COLUMNS = ["text", "full_text"]
+# Kolom tambahan yang ikut ditulis ke output jika tersedia
+PASSTHROUGH_COLUMNS = ["id_str"]
+
+def detect_format(filepath: str):
+    """Deteksi delimiter dan kolom teks dari header file CSV
+
+    Parameters
+    ----------
+    filepath : str
+        Jalur file CSV input.
+
+    Returns
+    -------
+    delimiter : str
+        Delimiter file CSV.
+
+    usecols : list of str
+        Kolom yang perlu dibaca, diawali kolom teks.
+    """
+    with open(filepath, encoding= "utf-8") as f:
+        header = f.readline()
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    columns = [column.strip() for column in header.split(delimiter)]
+    text_column = next((c for c in TEXT_COLUMNS if c in columns), None)
+    if text_column is None:
+        raise ValueError(f"Kolom teks ({', '.join(TEXT_COLUMNS)}) tidak "
+                         f"ditemukan pada {filepath}")
+    return delimiter, [text_column] + \
+        [c for c in PASSTHROUGH_COLUMNS if c in columns]
+
+def _init_worker():
+    """Muat vectorizer dan model sekali untuk setiap worker
+
+    Stemming kosakata baru di dalam worker otomatis berjalan tanpa process
+    pool (lihat stem_vocabulary), sehingga tidak ada pool bersarang.
+    """
+    load_predictor()
+
+def _score_chunk(chunk):
+    """Prediksi satu chunk di dalam worker
+    """
+    texts = chunk.iloc[:, 0].fillna("").astype(str)
+    result = predict_sentiment(texts.tolist())
+    result.index = chunk.index
+    return pd.concat([chunk, result], axis= 1)
+
+def _write(result, output_path, n_written):
+    """Tulis hasil satu chunk ke output
+    """
+    result.to_csv(output_path, mode= "w" if n_written == 0 else "a",
+                  header= n_written == 0, index= False)
+    return len(result)
+
+def batch_score(input_path: str, output_path: str, chunksize: int= 10_000,
+                workers: int= None):
+    """Prediksi sentimen seluruh tweet dalam file CSV
+
+    File input dibaca per chunk dan setiap chunk diprediksi pada process
+    pool (start method spawn). Setiap worker memuat vectorizer dan model
+    sekali saat dimulai. Hasil ditulis ke output sesuai urutan input; jika
+    input tidak memuat tweet, output tetap ditulis dengan baris header.
+
+    Parameters
+    ----------
+    input_path : str
+        Jalur file CSV input.
+
+    output_path : str
+        Jalur file CSV output.
+
+    chunksize : int
+        Jumlah baris dalam setiap chunk.
+
+    workers : int
+        Jumlah worker. Jika None, gunakan jumlah core CPU.
+
+    Returns
+    -------
+    n_rows : int
+        Jumlah tweet yang diprediksi.
+
+    elapsed : float
+        Lama proses dalam detik.
+    """
+    start = time.perf_counter()
+    delimiter, usecols = detect_format(input_path)
+    reader = pd.read_csv(input_path, delimiter= delimiter, usecols= usecols,
+                         dtype= str, chunksize= chunksize)
+    workers = workers or os.cpu_count() or 1
+    n_rows = 0
+    with process_pool(workers, initializer= _init_worker) as executor:
+        # Batasi jumlah chunk yang sedang diproses agar memori tetap terbatas
+        pending = []
+        for chunk in reader:
+            if chunk.empty:
+                continue
+            pending.append(executor.submit(_score_chunk, chunk[usecols]))
+            if len(pending) >= workers * 2:
+                n_rows += _write(pending.pop(0).result(), output_path, n_rows)
+        for future in pending:
+            n_rows += _write(future.result(), output_path, n_rows)
+    if n_rows == 0:
+        # Output tetap dibuat agar job terjadwal selalu memiliki file hasil
+        classes = load_predictor()[1].classes_.tolist()
+        _write(pd.DataFrame(columns= usecols + ["prediksi"] + classes),
+               output_path, 0)
+
+    return n_rows, time.perf_counter() - start
+
+def main(argv= None):
+    parser = argparse.ArgumentParser(
+        description= "Prediksi sentimen seluruh tweet dalam file CSV.")
+    parser.add_argument("input", help= "file CSV input")
+    parser.add_argument("output", help= "file CSV output")
+    parser.add_argument("--chunksize", type= int, default= 10_000,
+                        help= "jumlah baris per chunk (default: 10000)")
+    parser.add_argument("--workers", type= int, default= None,
+                        help= "jumlah worker (default: jumlah core CPU)")
+    args = parser.parse_args(argv)
+
+    n_rows, elapsed = batch_score(args.input, args.output, args.chunksize,
+                                  args.workers)
+    print(f"{n_rows} tweet diprediksi dalam {elapsed:.2f} detik "
+          f"({n_rows / max(elapsed, 1e-9):.1f} tweet/detik)")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+# Library / module / pustaka
+import argparse, json, subprocess, sys, tempfile, time, tracemalloc
+
+from functions import *
+
+"""Benchmark pemrosesan teks dan training
+
+Mengukur throughput dan memori puncak setiap tahapan (text_cleaning,
+remv_slang, word_tokenize, tokenize_batch, stemming, stopword_removal,
+feature_extraction, model_trained) secara terpisah serta end-to-end, pada
+korpus tweet sintetis berukuran 1k, 100k, dan 1M baris. Korpus dibangkitkan dari kosakata
+`word_counts.csv` dan `slang_word.csv`. Hasil ditambahkan sebagai JSON Lines
+ke `./data/bench/results.jsonl` agar dapat dibandingkan antar run. Waktu
+cold import `functions` dan skrip headless juga diukur terhadap batas
+`IMPORT_BUDGET`. Artefak, StemCache, dan TokenTable benchmark disimpan di
+folder sementara. Tahapan yang memakai cache persisten dicatat dua kali:
+`seconds` untuk run cold (cache kosong) dan `warm_seconds` untuk run
+berikutnya. Jalankan dari root repository:
+
+    $ python src/benchmark.py --sizes 1000,100000
+    $ python src/benchmark.py --import-only
+"""
+
+# Batas waktu cold import setiap modul dalam detik
+IMPORT_BUDGET = 1.5
+# Modul yang diukur waktu importnya
+IMPORT_MODULES = ["functions", "batch_score", "server", "ingest", "preprocess",
+                  "benchmark"]
+
+def generate_corpus(n_rows: int, seed: int= 42):
+    """Bangkitkan korpus tweet sintetis
+
+    Kata diambil dari `word_counts.csv` sesuai frekuensinya, sebagian diganti
+    slang-word dari `slang_word.csv`, lalu ditambahkan mention, hashtag, URL,
+    angka, dan emoticon agar setiap tahapan text cleaning ikut teruji.
+
+    Parameters
+    ----------
+    n_rows : int
+        Jumlah tweet.
+
+    seed : int
+        Seed untuk random generator.
+
+    Returns
+    -------
+    texts : pandas.Series
+        Teks tweet sintetis.
+
+    labels : ndarray
+        Label sentimen acak ("positif" atau "negatif").
+    """
+    rng = np.random.default_rng(seed)
+    counts = get_csv("./data/corpus/word_counts.csv").dropna()
+    vocab = counts["Word"].astype(str).to_numpy()
+    weights = counts["Count"].to_numpy(dtype= float)
+    weights /= weights.sum()
+    slangs = np.array(list(lexicons.get("slang")))
+    extras = np.array(["@pengguna", "#chatgpt", "https://t.co/abc", "2024",
+                       "\U0001F602", "AI", "-", "!!"])
+
+    texts = []
+    for start in range(0, n_rows, 100_000):
+        n = min(100_000, n_rows - start)
+        lengths = rng.integers(5, 30, size= n)
+        tokens = vocab[rng.choice(len(vocab), size= lengths.sum(), p= weights)]
+        # Sekitar 15% kata diganti slang-word dan 10% ditambah token ekstra
+        mask = rng.random(tokens.shape[0]) < .15
+        tokens[mask] = slangs[rng.integers(0, len(slangs), size= mask.sum())]
+        mask = rng.random(tokens.shape[0]) < .10
+        tokens[mask] = extras[rng.integers(0, len(extras), size= mask.sum())]
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        texts.extend(" ".join(tokens[offsets[i]:offsets[i + 1]])
+                     for i in range(n))
+    labels = rng.choice(["positif", "negatif"], size= n_rows)
+    return pd.Series(texts), labels
+
+def measure(func, *args, memory: bool= True, reset= None):
+    """Ukur waktu dan memori puncak sebuah fungsi
+
+    Waktu diukur tanpa tracemalloc; jika `memory` aktif, fungsi dijalankan
+    sekali lagi di bawah tracemalloc untuk mengukur memori puncak.
+
+    Parameters
+    ----------
+    reset : callable
+        Kosongkan cache persisten yang dipakai fungsi. Jika diberikan, waktu
+        diukur pada run cold (setelah `reset`) dan run warm berikutnya, dan
+        memori puncak diukur pada run cold.
+
+    Returns
+    -------
+    result : any
+        Hasil dari fungsi.
+
+    seconds : float
+        Lama eksekusi dalam detik (run cold jika `reset` diberikan).
+
+    warm_seconds : float or None
+        Lama eksekusi run warm, atau None jika `reset` tidak diberikan.
+
+    peak_mb : float or None
+        Memori puncak yang dialokasikan dalam MB.
+    """
+    if reset is not None:
+        reset()
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    warm_seconds = None
+    if reset is not None:
+        start = time.perf_counter()
+        func(*args)
+        warm_seconds = time.perf_counter() - start
+    peak_mb = None
+    if memory:
+        if reset is not None:
+            reset()
+        tracemalloc.start()
+        func(*args)
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return result, seconds, warm_seconds, peak_mb
+
+def measure_import(modules= IMPORT_MODULES, repeat: int= 3):
+    """Ukur waktu cold import modul
+
+    Setiap modul diimpor pada proses Python baru tanpa akses jaringan
+    (`NLTK_DOWNLOAD` dikosongkan). Waktu yang dilaporkan adalah nilai minimum dari
+    beberapa percobaan dikurangi waktu start interpreter kosong.
+
+    Parameters
+    ----------
+    modules : list of str
+        Nama modul di dalam folder `src`.
+
+    repeat : int
+        Jumlah percobaan untuk setiap modul.
+
+    Returns
+    -------
+    dict
+        Pasangan nama modul -> waktu import dalam detik.
+    """
+    env = {**os.environ, "NLTK_DOWNLOAD": ""}
+    srcdir = os.path.dirname(os.path.abspath(__file__))
+
+    def cold(statement):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", statement], cwd= srcdir,
+                           env= env, check= True, capture_output= True)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    baseline = cold("pass")
+    return {module: max(cold(f"import {module}") - baseline, 0.0)
+            for module in modules}
+
+def run_stages(texts, labels, cache_dir: str, memory: bool= True):
+    """Jalankan setiap tahapan secara terpisah dan end-to-end
+
+    Parameters
+    ----------
+    cache_dir : str
+        Folder sementara untuk StemCache dan TokenTable. Setiap run cold
+        memakai subfolder baru yang masih kosong.
+
+    Returns
+    -------
+    list of dict
+        Satu record untuk setiap tahapan.
+    """
+    stem = stemming.__wrapped__   # Lewati cache Streamlit
+    records = []
+    resets = itertools.count()
+
+    def reset():
+        set_cache_dir(os.path.join(cache_dir, f"cold{next(resets)}"))
+
+    def record(stage, rows, func, *args, cached= False):
+        result, seconds, warm_seconds, peak_mb = measure(
+            func, *args, memory= memory, reset= reset if cached else None)
+        records.append({"stage": stage, "rows": rows,
+                        "seconds": round(seconds, 6),
+                        "rows_per_sec": round(rows / max(seconds, 1e-9), 1),
+                        "warm_seconds": None if warm_seconds is None else
+                                        round(warm_seconds, 6),
+                        "peak_mem_mb": None if peak_mb is None else
+                                       round(peak_mb, 3)})
+        print(f"  {stage:<24} {seconds:>10.3f}s {rows / max(seconds, 1e-9):>14,.0f} rows/s"
+              + ("" if warm_seconds is None else
+                 f"  (warm {warm_seconds:.3f}s)")
+              + ("" if peak_mb is None else f" {peak_mb:>10.1f} MB"))
+        return result
+
+    n = len(texts)
+    record("text_cleaning", n, lambda s: s.apply(text_cleaning), texts)
+    cleaned = record("text_cleaning_batch", n, text_cleaning_batch, texts)
+    slang = record("remv_slang", n, remv_slang, cleaned)
+    record("word_tokenize", n, lambda s: s.apply(word_tokenize), slang)
+    tokens = record("tokenize_batch", n, tokenize_batch, slang)
+    stemmed = record("stemming", n, stem, tokens, cached= True)
+    filtered = record("stopword_removal", n, stopword_removal, stemmed)
+    final = filtered.apply(" ".join).values
+    train_vectors, _, _ = record("feature_extraction", n,
+                                 lambda X, y: feature_extraction(
+                                     X, y, cache= False), final, labels)
+    y_train = artifacts.load(artifacts.latest("features"),
+                             ["y_train"])["y_train"]
+    record("model_trained", train_vectors.shape[0],
+           lambda X, y: model_trained(X, y, cache= False, C= 0.01),
+           train_vectors, y_train)
+
+    def end_to_end(texts, labels):
+        final = text_preprocessing(texts, token_columns= None)["final"].values
+        train_vectors, _, _ = feature_extraction(final, labels, cache= False)
+        y_train = artifacts.load(artifacts.latest("features"),
+                                 ["y_train"])["y_train"]
+        return model_trained(train_vectors, y_train, cache= False, C= 0.01)
+    record("end_to_end", n, end_to_end, texts, labels, cached= True)
+
+    return records
+
+def main(argv= None):
+    parser = argparse.ArgumentParser(
+        description= "Benchmark setiap tahapan pemrosesan teks dan training.")
+    parser.add_argument("--sizes", default= "1000,100000,1000000",
+                        help= "ukuran korpus, dipisahkan koma")
+    parser.add_argument("--output", default= "./data/bench/results.jsonl",
+                        help= "file JSON Lines untuk hasil benchmark")
+    parser.add_argument("--no-memory", action= "store_true",
+                        help= "lewati pengukuran memori puncak")
+    parser.add_argument("--import-budget", type= float, default= IMPORT_BUDGET,
+                        help= "batas waktu cold import dalam detik")
+    parser.add_argument("--import-only", action= "store_true",
+                        help= "hanya ukur waktu import")
+    args = parser.parse_args(argv)
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output= True,
+                                text= True).stdout.strip() or None
+    except OSError:
+        commit = None
+    meta = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": commit}
+
+    print("Cold import")
+    results, over_budget = [], []
+    for module, seconds in measure_import().items():
+        status = "OK" if seconds <= args.import_budget else "MELEBIHI BATAS"
+        print(f"  {module:<24} {seconds:>10.3f}s  {status}")
+        if seconds > args.import_budget:
+            over_budget.append(module)
+        results.append({**meta, "size": None, "stage": f"import:{module}",
+                        "rows": None, "seconds": round(seconds, 6),
+                        "rows_per_sec": None, "warm_seconds": None,
+                        "peak_mem_mb": None, "budget": args.import_budget})
+
+    # Artefak dan cache benchmark disimpan terpisah agar tidak menimpa milik
+    # aplikasi dan setiap korpus dimulai dari cache kosong
+    root = artifacts.root
+    with tempfile.TemporaryDirectory() as tempdir:
+        artifacts.root = os.path.join(tempdir, "artifacts")
+        cache_dir = set_cache_dir(os.path.join(tempdir, "cache"))
+        try:
+            sizes = [] if args.import_only else args.sizes.split(",")
+            for size in map(int, sizes):
+                print(f"Korpus {size:,} baris")
+                texts, labels = generate_corpus(size)
+                for record in run_stages(texts, labels,
+                                         os.path.join(tempdir, f"cache{size}"),
+                                         memory= not args.no_memory):
+                    results.append({**meta, "size": size, **record})
+        finally:
+            artifacts.root = root
+            set_cache_dir(cache_dir)
+
+    mk_dir(os.path.dirname(args.output))
+    with open(args.output, "a") as f:
+        for record in results:
+            f.write(json.dumps(record) + "\n")
+    print(f"Hasil ditulis ke {args.output}")
+    return 1 if over_budget else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+# Library / module / pustaka
+import argparse, sys, time
+
+from functions import *
+
+"""Impor hasil crawler
+
+Skrip untuk menambahkan tweet dari file hasil crawler (format
+`data_tweets.csv`) ke dataset kerja `tweets.csv` tanpa membuka Streamlit.
+Tweet yang sudah pernah diimpor dan tweet dengan bahasa lain dilewati.
+Jalankan dari root repository:
+
+    $ python src/ingest.py data/dataset/data_tweets.csv
+    $ python src/ingest.py crawl/*.csv --lang in,en
+"""
+
+def main(argv= None):
+    parser = argparse.ArgumentParser(
+        description= "Impor hasil crawler ke dataset kerja.")
+    parser.add_argument("inputs", nargs= "+", help= "file CSV hasil crawler")
+    parser.add_argument("--target", default= "./data/dataset/tweets.csv",
+                        help= "dataset kerja (default: tweets.csv)")
+    parser.add_argument("--lang", default= "in",
+                        help= "kode bahasa, dipisahkan koma; kosongkan untuk "
+                              "semua bahasa (default: in)")
+    parser.add_argument("--chunksize", type= int, default= 50_000,
+                        help= "jumlah baris per chunk (default: 50000)")
+    args = parser.parse_args(argv)
+
+    lang = [code for code in args.lang.split(",") if code] or None
+    for filepath in args.inputs:
+        start = time.perf_counter()
+        stats = ingest_crawler_export(filepath, args.target, lang= lang,
+                                      chunksize= args.chunksize)
+        print(f"{filepath}: {stats['appended']} tweet ditambahkan, "
+              f"{stats['duplicate']} duplikat, {stats['lang']} bahasa lain "
+              f"({time.perf_counter() - start:.2f} detik)")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+# Library / module / pustaka
+import argparse, sys, time
+
+from functions import *
+
+"""Pemrosesan teks streaming
+
+Skrip untuk menjalankan seluruh tahapan pemrosesan teks pada file CSV yang
+lebih besar dari memori tanpa membuka Streamlit. File dibaca dan diproses
+per chunk, lalu hasilnya ditulis secara atomik ke file output. Output
+memuat kolom `hash`, sehingga aplikasi cukup memproses tweet baru saat
+`tweets.csv` bertambah. Jalankan dari root repository:
+
+    $ python src/preprocess.py data/dataset/tweets.csv
+    $ python src/preprocess.py crawl.csv --column full_text --delimiter ,
+"""
+
+def main(argv= None):
+    parser = argparse.ArgumentParser(
+        description= "Pemrosesan teks streaming per chunk.")
+    parser.add_argument("input", help= "file CSV yang memuat teks tweet")
+    parser.add_argument("--output",
+                        default= "./data/dataset/prepros_result.csv",
+                        help= "file CSV hasil (default: prepros_result.csv)")
+    parser.add_argument("--column", default= "text",
+                        help= "nama kolom teks (default: text)")
+    parser.add_argument("--delimiter", default= ";",
+                        help= "delimiter file input (default: ;)")
+    parser.add_argument("--chunksize", type= int, default= 10_000,
+                        help= "jumlah baris per chunk (default: 10000)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    n_rows = text_preprocessing_stream(args.input, args.output,
+                                       chunksize= args.chunksize,
+                                       column= args.column,
+                                       delimiter= args.delimiter)
+    print(f"{args.input}: {n_rows} tweet diproses ke {args.output} "
+          f"({time.perf_counter() - start:.2f} detik)")
+
+if __name__ == "__main__":
+    sys.exit(main())
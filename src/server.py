@@ -0,0 +1,258 @@
+# Library / module / pustaka
+import argparse, json, queue, sys, threading, time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from functions import *
+
+"""Layanan HTTP prediksi sentimen
+
+Server HTTP lokal yang membungkus pemrosesan teks dan model Regresi Logistik
+agar dapat dipanggil oleh tools lain. Request yang datang bersamaan digabung
+menjadi micro-batch dalam jendela waktu singkat, sehingga vektorisasi dan
+`predict_proba` dijalankan per batch. Jalankan dari root repository:
+
+    $ python src/server.py --port 8600
+
+Endpoint:
+    POST /predict   {"text": "..."} atau {"texts": ["...", "..."]}
+    GET  /metrics   latency p50/p99, throughput, dan ukuran batch
+    GET  /health    status server
+"""
+
+class MicroBatcher:
+    """Penggabung request menjadi micro-batch
+
+    Thread latar belakang mengambil request dari antrean, menunggu hingga
+    `window` detik atau hingga `max_batch` teks terkumpul, lalu memprediksi
+    semuanya sekaligus dengan predict_sentiment.
+
+    Parameters
+    ----------
+    window : float
+        Lama jendela pengumpulan batch dalam detik.
+
+    max_batch : int
+        Jumlah teks maksimum dalam satu batch.
+
+    history : int
+        Jumlah latency request terakhir yang disimpan untuk metrik.
+    """
+    def __init__(self, window: float= 0.005, max_batch: int= 256,
+                 history: int= 10_000):
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen= history)
+        self._batch_sizes = deque(maxlen= history)
+        self._started = time.time()
+        self._n_texts = 0
+        self._n_requests = 0
+        threading.Thread(target= self._run, daemon= True).start()
+
+    def submit(self, texts):
+        """Kirim teks untuk diprediksi
+
+        Parameters
+        ----------
+        texts : list of str
+            Teks tweet mentah.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future yang berisi list hasil prediksi, satu dict per teks.
+        """
+        future = Future()
+        if not texts:
+            # Batch kosong tidak perlu masuk antrean
+            future.set_result([])
+            return future
+        self._queue.put((texts, future, time.perf_counter()))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            size = len(batch[0][0])
+            deadline = time.perf_counter() + self.window
+            while size < self.max_batch:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout= timeout)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                size += len(item[0])
+            self._predict(batch, size)
+
+    def _predict(self, batch, size):
+        texts = [text for item in batch for text in item[0]]
+        try:
+            records = predict_sentiment(texts).to_dict(orient= "records")
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        done = time.perf_counter()
+        offset = 0
+        with self._lock:
+            self._batch_sizes.append(size)
+            self._n_texts += size
+            self._n_requests += len(batch)
+            for item_texts, future, submitted in batch:
+                self._latencies.append(done - submitted)
+                future.set_result(records[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+
+    def metrics(self):
+        """Metrik latency dan throughput
+
+        Returns
+        -------
+        dict
+            Latency p50 dan p99 dalam milidetik, throughput dalam tweet per
+            detik sejak server berjalan, dan rata-rata ukuran batch.
+        """
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            batch_sizes = np.array(self._batch_sizes)
+            n_texts, n_requests = self._n_texts, self._n_requests
+        uptime = time.time() - self._started
+        return {
+            "requests": n_requests,
+            "tweets": n_texts,
+            "uptime_s": round(uptime, 3),
+            "throughput_tps": round(n_texts / uptime, 3) if uptime else 0.0,
+            "latency_p50_ms": float(np.percentile(latencies, 50))
+                              if len(latencies) else None,
+            "latency_p99_ms": float(np.percentile(latencies, 99))
+                              if len(latencies) else None,
+            "mean_batch_size": float(batch_sizes.mean())
+                               if len(batch_sizes) else None
+        }
+
+class PredictHandler(BaseHTTPRequestHandler):
+    """Handler HTTP untuk endpoint /predict, /metrics, dan /health
+    """
+    batcher = None
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._send(200, self.batcher.metrics())
+        elif self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/predict":
+            self._send(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            texts = payload["texts"] if "texts" in payload else \
+                [payload["text"]]
+            if not isinstance(texts, list) or \
+                    not all(isinstance(text, str) for text in texts):
+                raise ValueError
+        except (KeyError, TypeError, ValueError):
+            self._send(400, {"error": "body harus berupa {\"text\": str} "
+                                      "atau {\"texts\": [str, ...]}"})
+            return
+        if not texts:
+            self._send(200, {"results": []})
+            return
+        try:
+            self._send(200, {"results": self.batcher.submit(texts).result()})
+        except Exception as e:
+            self._send(500, {"error": str(e)})
+
+    def log_message(self, format, *args):
+        # Nonaktifkan log per request agar tidak membebani hot path
+        pass
+
+class PredictServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer dengan antrean koneksi yang lebih panjang
+
+    Backlog bawaan socketserver hanya 5 koneksi, sehingga lonjakan request
+    bersamaan ditolak sebelum sempat digabung menjadi micro-batch.
+
+    Parameters
+    ----------
+    backlog : int
+        Jumlah koneksi yang dapat mengantre sebelum diterima server.
+    """
+    def __init__(self, address, handler, backlog: int= 128):
+        self.request_queue_size = backlog
+        super().__init__(address, handler)
+
+def serve(host: str= "127.0.0.1", port: int= 8600, window: float= 0.005,
+          max_batch: int= 256, backlog: int= 128):
+    """Jalankan server HTTP prediksi
+
+    Vectorizer dan model dimuat sebelum server menerima request, sehingga
+    request pertama tidak menanggung biaya pemuatan.
+
+    Parameters
+    ----------
+    host : str
+        Alamat host server.
+
+    port : int
+        Port server.
+
+    window : float
+        Lama jendela micro-batch dalam detik.
+
+    max_batch : int
+        Jumlah teks maksimum dalam satu batch.
+
+    backlog : int
+        Jumlah koneksi yang dapat mengantre sebelum diterima server.
+
+    Returns
+    -------
+    PredictServer
+        Server yang siap dijalankan dengan `serve_forever()`.
+    """
+    load_predictor()
+    PredictHandler.batcher = MicroBatcher(window, max_batch)
+    return PredictServer((host, port), PredictHandler, backlog)
+
+def main(argv= None):
+    parser = argparse.ArgumentParser(
+        description= "Layanan HTTP lokal untuk prediksi sentimen.")
+    parser.add_argument("--host", default= "127.0.0.1")
+    parser.add_argument("--port", type= int, default= 8600)
+    parser.add_argument("--window-ms", type= float, default= 5.0,
+                        help= "jendela micro-batch dalam milidetik")
+    parser.add_argument("--max-batch", type= int, default= 256,
+                        help= "jumlah teks maksimum per batch")
+    parser.add_argument("--backlog", type= int, default= 128,
+                        help= "panjang antrean koneksi (default: 128)")
+    args = parser.parse_args(argv)
+
+    server = serve(args.host, args.port, args.window_ms / 1000,
+                   args.max_batch, args.backlog)
+    print(f"Server berjalan di http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    sys.exit(main())
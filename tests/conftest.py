@@ -0,0 +1,6 @@
+# Konfigurasi pytest: modul aplikasi berada di folder src
+import os, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+# Tes tidak mengunduh resource NLTK
+os.environ.pop("NLTK_DOWNLOAD", None)
@@ -0,0 +1,62 @@
+# Library / module / pustaka
+import os, random
+
+import pandas as pd
+import pytest
+
+from functions import text_cleaning, text_cleaning_batch
+
+"""Kesetaraan text_cleaning_batch dengan text_cleaning
+
+text_cleaning_batch harus menghasilkan teks yang identik byte-per-byte dengan
+implementasi acuan text_cleaning untuk setiap tweet.
+"""
+
+DATASET = os.path.join(os.path.dirname(__file__), "..", "data", "dataset",
+                       "tweets.csv")
+
+# Kasus yang menyentuh setiap langkah pembersihan dan urutannya
+CASES = [
+    "",
+    "   ",
+    "Halo dunia",
+    "cek https://t.co/abc123 dan www.openai.com sekarang",
+    "@user_1 @#tag #@mention a#b @a#b #a@b",
+    "baris\\nbaru\\ttab \\u00e9 \\rkembali \\x",
+    "angka 123 dan 4.5, tanda-baca!? (kurung) [siku] {kurawal}",
+    "emoji 😀👍🏽 👨‍👩‍👧 #️⃣ 1️⃣ *️⃣ ©®",
+    "café naïve 中文 ١٢٣ Ｆｕｌｌ",
+    "a b c kata x y z",
+    "kata - kata -kata kata- kata - - -",
+    "ChatGPT SANGAT Membantu!!!",
+    "tab\tdan\nbaris baru\r\nwindows",
+]
+
+def _random_tweets(n, seed= 0):
+    rng = random.Random(seed)
+    pieces = list("abcXYZ019 -_#@\\.,!?'\"\t\n") + \
+        ["http://x.id/p", "www.", "\\n", "\\t", "😀", "👍🏽", "é", "中",
+         "١", "#️⃣", " - ", "@user", "#tag", "k"]
+    return ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 40)))
+            for _ in range(n)]
+
+@pytest.mark.parametrize("tweet", CASES)
+def test_batch_matches_reference_cases(tweet):
+    assert text_cleaning_batch([tweet]).iloc[0] == text_cleaning(tweet)
+
+def test_batch_matches_reference_random():
+    tweets = _random_tweets(5_000)
+    expected = [text_cleaning(tweet) for tweet in tweets]
+    assert text_cleaning_batch(tweets).tolist() == expected
+
+def test_batch_matches_reference_dataset():
+    tweets = pd.read_csv(DATASET, delimiter= ";")["text"].astype(str)
+    expected = tweets.apply(text_cleaning)
+    pd.testing.assert_series_equal(text_cleaning_batch(tweets), expected,
+                                   check_dtype= False, check_names= False)
+
+def test_batch_keeps_series_index():
+    data = pd.Series(["Halo @user", "#tag dunia"], index= [10, 3])
+    result = text_cleaning_batch(data)
+    assert result.index.tolist() == [10, 3]
+    assert result.tolist() == ["halo", "dunia"]
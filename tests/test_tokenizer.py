@@ -0,0 +1,59 @@
+# Library / module / pustaka
+import os, warnings
+
+import pandas as pd
+import pytest
+
+from functions import (check_tokenizer, remv_slang, text_cleaning,
+                       tokenize_batch, word_tokenize)
+
+"""Kesetaraan tokenizer "fast" dengan word_tokenize
+
+tokenize_batch(method="fast") harus menghasilkan token yang identik dengan
+word_tokenize untuk teks hasil text cleaning dan slang-word removal.
+"""
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DATASET = os.path.join(ROOT, "data", "dataset", "tweets.csv")
+
+def _punkt_available():
+    with warnings.catch_warnings():
+        # Resource yang belum tersedia dilaporkan oleh ensure_nltk_data
+        warnings.simplefilter("ignore")
+        try:
+            word_tokenize("tes")
+        except LookupError:
+            return False
+    return True
+
+pytestmark = pytest.mark.skipif(not _punkt_available(),
+                                reason= "resource NLTK punkt tidak tersedia")
+
+# Kasus yang harus dialihkan ke word_tokenize
+CASES = [
+    "",
+    "kata biasa saja",
+    "can't won't don't",
+    "tanda. baca, di! sini?",
+    "angka 3.14 dan 1,000",
+    "kutip \"ganda\" dan 'tunggal'",
+]
+
+@pytest.fixture
+def cleaned(monkeypatch):
+    # Kamus slang-word dibaca relatif terhadap root repo
+    monkeypatch.chdir(ROOT)
+    tweets = pd.read_csv(DATASET, delimiter= ";")["text"].astype(str)
+    return remv_slang(tweets.apply(text_cleaning))
+
+@pytest.mark.parametrize("text", CASES)
+def test_fast_matches_word_tokenize_cases(text):
+    assert tokenize_batch(pd.Series([text])).iloc[0] == word_tokenize(text)
+
+def test_fast_matches_word_tokenize_dataset(cleaned):
+    expected = cleaned.fillna("").astype(str).apply(word_tokenize)
+    assert tokenize_batch(cleaned).tolist() == expected.tolist()
+
+def test_check_tokenizer_dataset(cleaned):
+    diff = check_tokenizer(cleaned)
+    assert diff.empty, diff.head().to_string()